@@ -493,10 +493,12 @@ def _write_report():
     except:  # noqa: E722
         raise IOError(f"Could not load {config.template} template file '{template_mod.base_fn}'")
 
-    # Compress the report plot JSON data
+    # Compress the report plot JSON data. Skipping plots that embed their data next to their HTML
     runtime_compression_start = time.time()
     logger.debug("Compressing plot data")
-    report.plot_compressed_json = report.compress_json(report.plot_data)
+    report.plot_compressed_json = report.compress_json(
+        {pid: dump for pid, dump in report.plot_data.items() if pid not in report.plot_data_inline}
+    )
     report.runtimes["total_compression"] = time.time() - runtime_compression_start
 
     # Use jinja2 to render the template and overwrite
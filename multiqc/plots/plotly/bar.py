@@ -117,15 +117,15 @@ class Dataset(BaseDataset):
         """
         Create a Plotly figure for a dataset
         """
-        fig = go.Figure(layout=layout)
-
+        traces = []
         for cat in self.cats:
             data = cat["data_pct"] if is_pct else cat["data"]
 
             params = copy.deepcopy(self.trace_params)
             params["marker"]["color"] = f"rgb({cat['color']})"
-            fig.add_trace(
-                go.Bar(
+            traces.append(
+                dict(
+                    type="bar",
                     y=self.samples,
                     x=data,
                     name=cat["name"],
@@ -133,7 +133,8 @@ class Dataset(BaseDataset):
                     **params,
                 ),
             )
-        return fig
+        # Passing all traces at once, so they are validated together with the layout
+        return go.Figure(data=traces, layout=layout)
 
     def save_data_file(self) -> None:
         val_by_cat_by_sample = defaultdict(dict)
@@ -212,16 +213,6 @@ class BarPlot(Plot):
                 hoverformat=model.layout.yaxis.hoverformat,
                 ticksuffix=model.layout.yaxis.ticksuffix,
             ),
-            # Re-initiate legend to reset to default legend location on the top right
-            legend=go.layout.Legend(
-                # We use legend groups with subplots to simulate standard legend interactivity
-                # like we had a standard bar graph without subplots. We need to remove the space
-                # between the legend groups to make it look like a single legend.
-                tracegroupgap=0,
-                # Plotly plots the grouped bar graph in a reversed order in respect to
-                # the legend, so reversing the legend to match it:
-                traceorder="normal" if barmode != "group" else "reversed",
-            ),
             hovermode="y unified",
             hoverlabel=dict(
                 bgcolor="rgba(255, 255, 255, 0.8)",
@@ -229,16 +220,25 @@ class BarPlot(Plot):
             ),
             showlegend=pconfig.use_legend,
         )
+        # Re-initiate legend to reset to default legend location on the top right. Assigning
+        # instead of passing to update() above, so it replaces the legend rather than merging into it
+        model.layout.legend = dict(
+            # We use legend groups with subplots to simulate standard legend interactivity
+            # like we had a standard bar graph without subplots. We need to remove the space
+            # between the legend groups to make it look like a single legend.
+            tracegroupgap=0,
+            # Plotly plots the grouped bar graph in a reversed order in respect to
+            # the legend, so reversing the legend to match it:
+            traceorder="normal" if barmode != "group" else "reversed",
+        )
 
         if getattr(config, "barplot_legend_on_bottom", False):
-            model.layout.update(
-                legend=go.layout.Legend(
-                    orientation="h",
-                    x=0.5,
-                    xanchor="center",
-                    y=-0.5,
-                    yanchor="top",
-                ),
+            model.layout.legend = dict(
+                orientation="h",
+                x=0.5,
+                xanchor="center",
+                y=-0.5,
+                yanchor="top",
             )
 
         for dataset in model.datasets:
@@ -78,18 +78,18 @@ class Dataset(BaseDataset):
         """
         Create a Plotly figure for a dataset
         """
-        fig = go.Figure(layout=layout)
-
+        traces = []
         for sname, values in zip(self.samples, self.data):
             params = copy.deepcopy(self.trace_params)
-            fig.add_trace(
-                go.Box(
+            traces.append(
+                dict(
+                    type="box",
                     x=values,
                     name=sname,
                     **params,
                 ),
             )
-        return fig
+        return go.Figure(data=traces, layout=layout)
 
     def save_data_file(self) -> None:
         vals_by_sample = {}
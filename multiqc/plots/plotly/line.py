@@ -169,7 +169,7 @@ class Dataset(BaseDataset):
             # Extra space for legend
             layout.height += len(self.lines) * 5
 
-        fig = go.Figure(layout=layout)
+        traces = []
         for line in self.lines:
             xs = [x[0] for x in line["data"]]
             ys = [x[1] for x in line["data"]]
@@ -182,8 +182,9 @@ class Dataset(BaseDataset):
             params = update_dict(params, self.trace_params, none_only=True)
             params["marker"]["color"] = line.get("color")
 
-            fig.add_trace(
-                go.Scatter(
+            traces.append(
+                dict(
+                    type="scatter",
                     x=xs,
                     y=ys,
                     name=line["name"],
@@ -191,7 +192,7 @@ class Dataset(BaseDataset):
                     **params,
                 )
             )
-        return fig
+        return go.Figure(data=traces, layout=layout)
 
     def save_data_file(self) -> None:
         y_by_x_by_sample = dict()
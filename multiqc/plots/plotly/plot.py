@@ -3,18 +3,18 @@ import io
 import logging
 import random
 import re
-import string
 from enum import Enum
 from pathlib import Path
 from typing import Dict, Union, List, Optional, Tuple, Any
 
 import math
 import plotly.graph_objects as go
-from pydantic import BaseModel, field_validator, field_serializer, Field
+from pydantic import BaseModel, field_validator, field_serializer, Field, PrivateAttr
 
 from multiqc.plots.plotly import check_plotly_version
 from multiqc import config, report
 from multiqc.utils import mqc_colour
+from multiqc.utils.util_functions import dump_json_bytes
 from multiqc.validation import ValidatedConfig
 
 logger = logging.getLogger(__name__)
@@ -130,6 +130,17 @@ class BaseDataset(BaseModel):
         """
         raise NotImplementedError
 
+    def _fast_dump(self) -> Dict:
+        """
+        Copy of the fields for the plot dump. Unlike `model_dump`, doesn't convert every data point,
+        so expects fields to hold JSON-compatible data. Override for other field types.
+        """
+        return _copy_containers(self.__dict__)
+
+
+# Plot fields too big to show in the repr
+_REPR_EXCLUDE = frozenset({"datasets", "layout"})
+
 
 class Plot(BaseModel):
     """
@@ -150,11 +161,19 @@ class Plot(BaseModel):
     square: bool = False
     flat: bool = False
 
+    # Plain-dict snapshot of `layout`, shared by the figures built in `flat_plot`
+    _layout_dict: Optional[Dict] = PrivateAttr(None)
+    # HTML attribute to link plot controls to the plot
+    _pid_attr: str = PrivateAttr("")
+
     model_config = dict(
         arbitrary_types_allowed=True,
         use_enum_values=True,
     )
 
+    def model_post_init(self, __context: Any) -> None:
+        self._pid_attr = f'data-pid="{self.id}"'
+
     @field_serializer("layout")
     def serialize_dt(self, layout: go.Layout, _info):
         return layout.to_plotly_json()
@@ -195,7 +214,7 @@ class Plot(BaseModel):
 
         id = id or pconfig.id
         if id is None:  # id of the plot group
-            uniq_suffix = "".join(random.sample(string.ascii_lowercase, 10))
+            uniq_suffix = f"{random.getrandbits(40):010x}"
             id = f"mqc_plot_{uniq_suffix}"
         id = report.save_htmlid(id)
 
@@ -221,58 +240,16 @@ class Plot(BaseModel):
             showlegend = True if flat else False
 
         layout = go.Layout(
-            title=go.layout.Title(
-                text=pconfig.title,
-                xanchor="center",
-                x=0.5,
-                font=dict(size=20),
-            ),
-            xaxis=go.layout.XAxis(
-                gridcolor="rgba(0,0,0,0.05)",
-                zerolinecolor="rgba(0,0,0,0.05)",
-                color="rgba(0,0,0,0.3)",  # axis labels
-                tickfont=dict(size=10, color="rgba(0,0,0,1)"),
-                automargin=True,  # auto-expand axis to fit the tick labels
-            ),
-            yaxis=go.layout.YAxis(
-                gridcolor="rgba(0,0,0,0.05)",
-                zerolinecolor="rgba(0,0,0,0.05)",
-                color="rgba(0,0,0,0.3)",  # axis labels
-                tickfont=dict(size=10, color="rgba(0,0,0,1)"),
-                automargin=True,  # auto-expand axis to fit the tick labels
-            ),
-            height=height,
-            width=width,
-            paper_bgcolor="white",
-            plot_bgcolor="white",
-            font=dict(family="'Lucida Grande', 'Open Sans', verdana, arial, sans-serif"),
-            colorway=mqc_colour.mqc_colour_scale.COLORBREWER_SCALES["plot_defaults"],
-            autosize=True,
-            margin=go.layout.Margin(
-                pad=5,  # pad sample names in a bar graph a bit
-                t=50,  # more compact title
-                r=15,  # remove excessive whitespace on the right
-                b=65,  # remove excessive whitespace on the bottom
-                l=60,  # remove excessive whitespace on the left
-            ),
-            hoverlabel=go.layout.Hoverlabel(
-                namelength=-1,  # do not crop sample names inside hover label <extra></extra>
-            ),
-            modebar=go.layout.Modebar(
-                bgcolor="rgba(0, 0, 0, 0)",
-                color="rgba(0, 0, 0, 0.5)",
-                activecolor="rgba(0, 0, 0, 1)",
-            ),
-            showlegend=showlegend,
-            legend=go.layout.Legend(
-                orientation="h",
-                yanchor="top",
-                y=-0.15,
-                xanchor="center",
-                x=0.5,
+            _merge_layout_dicts(
+                _LAYOUT_TEMPLATE,
+                dict(
+                    title=dict(text=pconfig.title),
+                    height=height,
+                    width=width,
+                    showlegend=showlegend,
+                    legend=_FLAT_LEGEND if flat else None,
+                ),
             )
-            if flat
-            else None,
         )
         # Layout update for the counts/percentage switch
         pct_axis_update = dict(
@@ -296,9 +273,10 @@ class Plot(BaseModel):
         dconfigs: List[Union[str, Dict[str, str]]] = pconfig.data_labels
         datasets = []
         for idx in range(n_datasets):
+            idx_str = str(idx + 1)
             dataset = BaseDataset(
                 plot_id=id,
-                label=str(idx + 1),
+                label=idx_str,
                 uid=id,
                 dconfig=dict(),
                 layout=dict(),
@@ -309,7 +287,7 @@ class Plot(BaseModel):
                 ),
             )
             if n_datasets > 1:
-                dataset.uid += f"_{idx + 1}"
+                dataset.uid += f"_{idx_str}"
 
             if idx < len(dconfigs):
                 dconfig = dconfigs[idx]
@@ -319,11 +297,13 @@ class Plot(BaseModel):
             if not isinstance(dconfig, (str, dict)):
                 logger.warning(f"Invalid data_labels type: {type(dconfig)}. Must be a string or a dict.")
             dconfig = dconfig if isinstance(dconfig, dict) else {"name": dconfig}
-            dataset.label = dconfig.get("name", dconfig.get("label", str(idx + 1)))
+            # Dataset name is taken from the first of the "name" and "label" keys that is present
+            name_key = next((k for k in ("name", "label") if k in dconfig), None)
+            dataset.label = dconfig[name_key] if name_key else idx_str
             if "ylab" not in dconfig and not pconfig.ylab:
-                dconfig["ylab"] = dconfig.get("name", dconfig.get("label"))
+                dconfig["ylab"] = dconfig[name_key] if name_key else None
             if n_datasets > 1 and "title" not in dconfig:
-                dconfig["title"] = f'{pconfig.title} ({dconfig["name"]})'
+                dconfig["title"] = f"{pconfig.title} ({dataset.label})"
 
             dataset.layout, dataset.trace_params = _dataset_layout(pconfig, dconfig, default_tt_label)
             dataset.dconfig = dconfig
@@ -425,29 +405,42 @@ class Plot(BaseModel):
         else:
             dataset = self.datasets[dataset_id]
 
-        layout = go.Layout(self.layout.to_plotly_json())  # make a copy
-        layout.update(**dataset.layout)
+        layout = _merge_layout_dicts(self._base_layout_dict(), dataset.layout)
         if flat:
-            layout.width = FLAT_PLOT_WIDTH
+            layout["width"] = FLAT_PLOT_WIDTH
         for axis in self.axis_controlled_by_switches:
-            layout[axis].type = "linear"
-            minval = layout[axis].autorangeoptions["minallowed"]
-            maxval = layout[axis].autorangeoptions["maxallowed"]
+            # Copying the axis parts that are modified below, the rest is shared with the base layout
+            axis_layout = layout[axis] = dict(layout.get(axis) or {})
+            autorangeoptions = axis_layout["autorangeoptions"] = dict(axis_layout.get("autorangeoptions") or {})
+            axis_layout["type"] = "linear"
+            minval = autorangeoptions.get("minallowed")
+            maxval = autorangeoptions.get("maxallowed")
             if is_pct:
-                layout[axis].update(self.pct_axis_update)
+                axis_layout.update(self.pct_axis_update)
                 minval = dataset.pct_range.get(axis, {}).get("min", 0)
                 maxval = dataset.pct_range.get(axis, {}).get("max", 100)
             if is_log:
-                layout[axis].type = "log"
+                axis_layout["type"] = "log"
                 minval = math.log10(minval) if minval is not None and minval > 0 else None
                 maxval = math.log10(maxval) if maxval is not None and maxval > 0 else None
-            layout[axis].autorangeoptions["minallowed"] = minval
-            layout[axis].autorangeoptions["maxallowed"] = maxval
-        return dataset.create_figure(layout, is_log, is_pct, **kwargs)
+            autorangeoptions["minallowed"] = minval
+            autorangeoptions["maxallowed"] = maxval
+        return dataset.create_figure(go.Layout(layout), is_log, is_pct, **kwargs)
+
+    def _base_layout_dict(self) -> Dict:
+        """
+        Serialize the base layout, instead of copying the go.Layout object for every figure.
+        `flat_plot` keeps one snapshot while creating all its figures. Otherwise reading the current
+        layout, as it's public and can be updated at any time.
+        """
+        if self._layout_dict is not None:
+            return self._layout_dict
+        return self.layout.to_plotly_json()
 
     def __repr__(self):
-        d = {k: v for k, v in self.__dict__.items() if k not in ("datasets", "layout")}
-        return f"<{self.__class__.__name__} {self.id} {d}>"
+        # Formatted the same way as a dict of the fields, without building the dict
+        items = ", ".join(f"{k!r}: {v!r}" for k, v in self.__dict__.items() if k not in _REPR_EXCLUDE)
+        return f"<{self.__class__.__name__} {self.id} {{{items}}}>"
 
     def add_to_report(self) -> str:
         """
@@ -487,12 +480,27 @@ class Plot(BaseModel):
             <div class="created-with-multiqc">Created with MultiQC</div>
         </div>"""
 
-        html += "</div>"
+        # Embedding the compressed data next to the plot, so JavaScript decompresses it only when
+        # the plot is scrolled into view. Keeping the dump in report.plot_data for the data exports.
+        dump = self._fast_dump()
+        report.plot_data[self.id] = dump
+        report.plot_data_inline.add(self.id)
+        html += f"""
+        <script type="text/plain" id="{self.id}-data" class="mqc-plot-data" data-pid="{self.id}" data-lazy="1">{report.compress_json_bytes(dump_json_bytes(dump))}</script>"""
 
-        # Saving compressed data for JavaScript to pick up and uncompress.
-        report.plot_data[self.id] = self.model_dump(warnings=False)
+        html += "</div>"
         return html
 
+    def _fast_dump(self) -> Dict:
+        """
+        Same as `model_dump`, but faster: copies the dataset containers instead of walking
+        through every data point with pydantic.
+        """
+        dump = self.model_dump(exclude={"layout", "datasets"}, warnings=False)
+        dump["layout"] = self._base_layout_dict()
+        dump["datasets"] = [ds._fast_dump() for ds in self.datasets]
+        return dump
+
     def flat_plot(self) -> str:
         html = "".join(
             [
@@ -510,66 +518,80 @@ class Plot(BaseModel):
             html += self.__control_panel(flat=True)
 
         # Go through datasets creating plots
-        for ds_idx, dataset in enumerate(self.datasets):
-            html += fig_to_static_html(
-                self.get_figure(ds_idx, flat=True),
-                active=ds_idx == 0 and not self.p_active and not self.l_active,
-                file_name=dataset.uid if not self.add_log_tab and not self.add_pct_tab else f"{dataset.uid}-cnt",
-            )
-            if self.add_pct_tab:
-                html += fig_to_static_html(
-                    self.get_figure(ds_idx, is_pct=True, flat=True),
-                    active=ds_idx == 0 and self.p_active,
-                    file_name=f"{dataset.uid}-pct",
-                )
-            if self.add_log_tab:
+        self._layout_dict = self.layout.to_plotly_json()
+        try:
+            for ds_idx, dataset in enumerate(self.datasets):
+                # The log10 views differ from the linear views only by the axis scale, so rendering the
+                # linear figures first, then switching them to the log scale instead of building new ones
+                fig = self.get_figure(ds_idx, flat=True)
+                pct_fig = self.get_figure(ds_idx, is_pct=True, flat=True) if self.add_pct_tab else None
                 html += fig_to_static_html(
-                    self.get_figure(ds_idx, is_log=True, flat=True),
-                    active=ds_idx == 0 and self.l_active,
-                    file_name=f"{dataset.uid}-log",
-                )
-            if self.add_pct_tab and self.add_log_tab:
-                html += fig_to_static_html(
-                    self.get_figure(ds_idx, is_pct=True, is_log=True, flat=True),
-                    active=ds_idx == 0 and self.p_active and self.l_active,
-                    file_name=f"{dataset.uid}-pct-log",
+                    fig,
+                    active=ds_idx == 0 and not self.p_active and not self.l_active,
+                    file_name=dataset.uid if not self.add_log_tab and not self.add_pct_tab else f"{dataset.uid}-cnt",
                 )
+                if pct_fig is not None:
+                    html += fig_to_static_html(
+                        pct_fig,
+                        active=ds_idx == 0 and self.p_active,
+                        file_name=f"{dataset.uid}-pct",
+                    )
+                if self.add_log_tab:
+                    for axis in self.axis_controlled_by_switches:
+                        _set_axis_log_scale(fig.layout[axis])
+                    html += fig_to_static_html(
+                        fig,
+                        active=ds_idx == 0 and self.l_active,
+                        file_name=f"{dataset.uid}-log",
+                    )
+                    if pct_fig is not None:
+                        for axis in self.axis_controlled_by_switches:
+                            _set_axis_log_scale(pct_fig.layout[axis])
+                        html += fig_to_static_html(
+                            pct_fig,
+                            active=ds_idx == 0 and self.p_active and self.l_active,
+                            file_name=f"{dataset.uid}-pct-log",
+                        )
+        finally:
+            self._layout_dict = None
 
         html += "</div>"
         return html
 
     def _btn(self, cls: str, label: str, data_attrs: Dict[str, str] = None, pressed: bool = False) -> str:
         """Build a switch button for the plot."""
-        data_attrs = data_attrs.copy() if data_attrs else {}
-        if "pid" not in data_attrs:
-            data_attrs["pid"] = self.id
-        data_attrs = " ".join([f'data-{k}="{v}"' for k, v in data_attrs.items()])
-        return f'<button class="btn btn-default btn-sm {cls} {"active" if pressed else ""}" {data_attrs}>{label}</button>\n'
+        attrs = "".join([f' data-{k}="{v}"' for k, v in data_attrs.items()]) if data_attrs else ""
+        if not data_attrs or "pid" not in data_attrs:
+            attrs += f" {self._pid_attr}"
+        return f'<button class="btn btn-default btn-sm {cls} {"active" if pressed else ""}"{attrs}>{label}</button>\n'
 
     def buttons(self, flat: bool) -> List[str]:
         """
         Build buttons for control panel
         """
-        switch_buttons = ""
+        parts: List[str] = []
         cls = "mpl_switch_group" if flat else "interactive-switch-group"
         # Counts / percentages / log10 switches
-        if self.add_pct_tab or self.add_log_tab:
-            if self.add_pct_tab:
-                switch_buttons += self._btn(
+        if self.add_pct_tab:
+            parts.append(
+                self._btn(
                     cls=f"{cls} percent-switch",
                     label=self.pconfig.cpswitch_percent_label,
                     pressed=self.p_active,
                 )
-            if self.add_log_tab:
-                switch_buttons += self._btn(
+            )
+        if self.add_log_tab:
+            parts.append(
+                self._btn(
                     cls=f"{cls} log10-switch",
                     label=self.pconfig.logswitch_label,
                     pressed=self.l_active,
                 )
+            )
 
         # Buttons to cycle through different datasets
         if len(self.datasets) > 1:
-            switch_buttons += f'<div class="btn-group {cls} dataset-switch-group">\n'
+            parts.append(f'<div class="btn-group {cls} dataset-switch-group">\n')
             for ds_idx, ds in enumerate(self.datasets):
                 data_attrs = {
                     "dataset-index": ds_idx,
@@ -577,18 +599,20 @@ class Plot(BaseModel):
                     # dataset and view, so have to save individual image IDs.
                     "dataset-uid": ds.uid,
                 }
-                switch_buttons += self._btn(
-                    cls="mr-auto",
-                    label=ds.label,
-                    data_attrs=data_attrs,
-                    pressed=ds_idx == 0,
+                parts.append(
+                    self._btn(
+                        cls="mr-auto",
+                        label=ds.label,
+                        data_attrs=data_attrs,
+                        pressed=ds_idx == 0,
+                    )
                 )
-            switch_buttons += "</div>\n\n"
+            parts.append("</div>\n\n")
 
         export_btn = ""
         if not flat:
             export_btn = self._btn(cls="export-plot", label="Export Plot")
-        return [switch_buttons, export_btn]
+        return ["".join(parts), export_btn]
 
     def __control_panel(self, flat: bool) -> str:
         """
@@ -610,12 +634,10 @@ def fig_to_static_html(
     Build one static image, return an HTML wrapper.
     """
     assert fig.layout.width
-    write_kwargs = dict(
-        width=fig.layout.width,  # While interactive plots take full width of screen,
-        # for the flat plots we explicitly set width
-        height=fig.layout.height,
-        scale=2,  # higher detail (retina display)
-    )
+    formats = list(config.export_plot_formats) if export_plots else []
+    if embed and "png" not in formats:
+        formats.append("png")
+    images = _render_flat_images(fig, formats)
 
     # Save the plot to the data directory if export is requested
     if export_plots:
@@ -626,16 +648,8 @@ def fig_to_static_html(
             plot_path.parent.mkdir(parents=True, exist_ok=True)
             short_path = Path(config.plots_dir_name) / file_ext / f"{file_name}.{file_ext}"
             logger.debug(f"Writing plot to {short_path}")
-            if file_ext == "svg":
-                # Cannot add logo to SVGs
-                fig.write_image(plot_path, **write_kwargs)
-            else:
-                img_buffer = io.BytesIO()
-                fig.write_image(img_buffer, **write_kwargs)
-                img_buffer = add_logo(img_buffer, format=file_ext)
-                with open(plot_path, "wb") as f:
-                    f.write(img_buffer.getvalue())
-                img_buffer.close()
+            with open(plot_path, "wb") as f:
+                f.write(images[file_ext])
 
     # Now writing the PNGs for the HTML
     if not embed:
@@ -644,13 +658,9 @@ def fig_to_static_html(
         # Using file written in the config.export_plots block above
         img_src = Path(config.plots_dir_name) / "png" / f"{file_name}.png"
     else:
-        img_buffer = io.BytesIO()
-        fig.write_image(img_buffer, **write_kwargs)
-        img_buffer = add_logo(img_buffer, format="PNG")
         # Convert to a base64 encoded string
-        b64_img = base64.b64encode(img_buffer.getvalue()).decode("utf8")
+        b64_img = base64.b64encode(images["png"]).decode("ascii")
         img_src = f"data:image/png;base64,{b64_img}"
-        img_buffer.close()
 
     # Should this plot be hidden on report load?
     hiding = "" if active else ' style="display:none;"'
@@ -664,45 +674,183 @@ def fig_to_static_html(
     )
 
 
+def _render_flat_images(fig: go.Figure, formats: List[str]) -> Dict[str, bytes]:
+    """
+    Render a figure into images of the given formats, return image bytes by format.
+    """
+    write_kwargs = dict(
+        width=fig.layout.width,  # While interactive plots take full width of screen,
+        # for the flat plots we explicitly set width
+        height=fig.layout.height,
+        scale=2,  # higher detail (retina display)
+    )
+    images: Dict[str, bytes] = {}
+    png_bytes: Optional[bytes] = None
+    for file_ext in formats:
+        if file_ext == "svg":
+            # Cannot add logo to SVGs
+            images[file_ext] = fig.to_image(format="svg", **write_kwargs)
+        else:
+            # Other formats are converted from the PNG with the logo added, so rendering it only once
+            if png_bytes is None:
+                png_bytes = fig.to_image(format="png", **write_kwargs)
+            with io.BytesIO(png_bytes) as img_buffer:
+                add_logo(img_buffer, format=file_ext)
+                images[file_ext] = img_buffer.getvalue()
+    return images
+
+
+# Width and rendered layer of the logo text, by text and font size
+_TEXT_WIDTH_CACHE: Dict[Tuple[str, int], float] = {}
+_TEXT_PATCH_CACHE: Dict[Tuple[str, int], Any] = {}
+
+
 def add_logo(
     img_buffer: io.BytesIO,
     format: str = "png",
     text: str = "Created with MultiQC",
     font_size: int = 16,
 ) -> io.BytesIO:
+    """
+    Add the MultiQC text logo to the image, and write it back into the same buffer in the
+    given format. Returns the same buffer; on failure, it keeps the original image.
+    """
+    original = img_buffer.getvalue()
     try:
         from PIL import Image, ImageDraw
 
-        # Load the image from the BytesIO object
-        image = Image.open(img_buffer)
+        Image.init()
+        if format.upper() not in Image.SAVE:
+            logger.warning(f"Failure adding logo to the plot: format '{format}' is not supported")
+            img_buffer.seek(0)
+            return img_buffer
 
-        # Create a drawing context
-        draw = ImageDraw.Draw(image)
+        # Load the image from the BytesIO object. Decoding it fully, as the buffer is overwritten below
+        image = Image.open(img_buffer)
+        image.load()
 
         # Define the text position. In order to do that, first calculate the expected
-        # text block width, given the font size.
-        # noinspection PyArgumentList
-        text_width: float = draw.textlength(text, font_size=font_size)
+        # text block width, given the font size. It's the same for all plots, so caching it.
+        key = (text, font_size)
+        text_width = _TEXT_WIDTH_CACHE.get(key)
+        if text_width is None:
+            # noinspection PyArgumentList
+            text_width = ImageDraw.Draw(image).textlength(text, font_size=font_size)
+            _TEXT_WIDTH_CACHE[key] = text_width
         position: Tuple[int, int] = (image.width - int(text_width) - 3, image.height - 30)
 
         # Draw the text
-        draw.text(position, text, fill="#9f9f9f", font_size=font_size)
+        if image.mode == "RGBA" and min(position) >= 0:
+            # Compositing the text rendered once onto a transparent layer gives the same pixels
+            # as drawing it, and saves rasterizing the glyphs for every plot
+            patch = _TEXT_PATCH_CACHE.get(key)
+            if patch is None:
+                draw = ImageDraw.Draw(image)
+                _, _, right, bottom = draw.textbbox((0, 0), text, font_size=font_size)
+                patch = Image.new("RGBA", (right, bottom), (0, 0, 0, 0))
+                ImageDraw.Draw(patch).text((0, 0), text, fill="#9f9f9f", font_size=font_size)
+                _TEXT_PATCH_CACHE[key] = patch
+            image.alpha_composite(patch, position)
+        else:
+            ImageDraw.Draw(image).text(position, text, fill="#9f9f9f", font_size=font_size)
 
-        # Save the image to a BytesIO object
-        output_buffer = io.BytesIO()
-        image.save(output_buffer, format=format)
-        output_buffer.seek(0)
+        # Save the image back into the same BytesIO object
+        img_buffer.seek(0)
+        img_buffer.truncate()
+        image.save(img_buffer, format=format)
 
     except Exception as e:
         logger.warning(f"Failure adding logo to the plot: {e}")
-        output_buffer = img_buffer
+        img_buffer.seek(0)
+        img_buffer.truncate()
+        img_buffer.write(original)
 
-    return output_buffer
+    img_buffer.seek(0)
+    return img_buffer
 
 
 # Default width for flat plots
 FLAT_PLOT_WIDTH = 1100
 
+# Plot layout fields shared by all plots. Plot.initialize adds the plot-specific ones
+_LAYOUT_TEMPLATE = dict(
+    title=dict(
+        xanchor="center",
+        x=0.5,
+        font=dict(size=20),
+    ),
+    xaxis=dict(
+        gridcolor="rgba(0,0,0,0.05)",
+        zerolinecolor="rgba(0,0,0,0.05)",
+        color="rgba(0,0,0,0.3)",  # axis labels
+        tickfont=dict(size=10, color="rgba(0,0,0,1)"),
+        automargin=True,  # auto-expand axis to fit the tick labels
+    ),
+    yaxis=dict(
+        gridcolor="rgba(0,0,0,0.05)",
+        zerolinecolor="rgba(0,0,0,0.05)",
+        color="rgba(0,0,0,0.3)",  # axis labels
+        tickfont=dict(size=10, color="rgba(0,0,0,1)"),
+        automargin=True,  # auto-expand axis to fit the tick labels
+    ),
+    paper_bgcolor="white",
+    plot_bgcolor="white",
+    font=dict(family="'Lucida Grande', 'Open Sans', verdana, arial, sans-serif"),
+    colorway=mqc_colour.mqc_colour_scale.COLORBREWER_SCALES["plot_defaults"],
+    autosize=True,
+    margin=dict(
+        pad=5,  # pad sample names in a bar graph a bit
+        t=50,  # more compact title
+        r=15,  # remove excessive whitespace on the right
+        b=65,  # remove excessive whitespace on the bottom
+        l=60,  # remove excessive whitespace on the left
+    ),
+    hoverlabel=dict(
+        namelength=-1,  # do not crop sample names inside hover label <extra></extra>
+    ),
+    modebar=dict(
+        bgcolor="rgba(0, 0, 0, 0)",
+        color="rgba(0, 0, 0, 0.5)",
+        activecolor="rgba(0, 0, 0, 1)",
+    ),
+)
+
+# Legend at the bottom of flat plots
+_FLAT_LEGEND = dict(
+    orientation="h",
+    yanchor="top",
+    y=-0.15,
+    xanchor="center",
+    x=0.5,
+)
+
+
+def _merge_layout_dicts(base: Dict, update: Dict) -> Dict:
+    """
+    Recursively merge a layout update into a copy of the base layout, following go.Layout.update.
+    Nested dicts that are not touched by the update are shared with the base layout, not copied.
+    """
+    merged = dict(base)
+    for k, v in update.items():
+        if isinstance(v, dict) and isinstance(merged.get(k), dict):
+            merged[k] = _merge_layout_dicts(merged[k], v)
+        else:
+            merged[k] = v
+    return merged
+
+
+def _copy_containers(data: Any) -> Any:
+    """
+    Recursively copy the dicts and lists in the data, sharing the other values. Enough to keep
+    a dump from changing with the plot, as only these containers are updated in place, e.g. by
+    `dump_json` replacing NaNs, and much cheaper than `copy.deepcopy` for many data points.
+    """
+    if isinstance(data, dict):
+        return {k: _copy_containers(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_copy_containers(v) for v in data]
+    return data
+
 
 def _set_axis_log_scale(axis):
     axis.type = "log"
@@ -728,6 +876,11 @@ def rename_deprecated_highcharts_keys(conf: Dict) -> Dict:
     return conf
 
 
+# Known axis suffixes, and the same suffixes by their stripped versions to set or remove the space
+_KNOWN_SUFFIXES = ("%", "x", "X", "k", "M", " bp", " kbp", " Mbp")
+_SUFFIX_BY_STRIPPED = {suf.strip(): suf for suf in _KNOWN_SUFFIXES}
+
+
 def _dataset_layout(
     pconfig: PConfig,
     dconfig: Dict,
@@ -736,10 +889,10 @@ def _dataset_layout(
     """
     Given plot config and dataset config, set layout and trace params.
     """
-    pconfig = pconfig.model_copy()
-    for k, v in dconfig.items():
-        if k in pconfig.model_fields:
-            setattr(pconfig, k, v)
+    # Only copying the plot config when the dataset overrides any of its fields
+    overrides = {k: v for k, v in dconfig.items() if k in type(pconfig).model_fields}
+    if overrides:
+        pconfig = pconfig.model_copy(update=overrides)
 
     ysuffix = pconfig.ysuffix if pconfig.ysuffix is not None else pconfig.tt_suffix
     xsuffix = pconfig.xsuffix
@@ -753,24 +906,22 @@ def _dataset_layout(
             xsuffix = pconfig.xlab_format.split("}")[1]
 
     # Set or remove space in known suffixes
-    KNOWN_SUFFIXES = ["%", "x", "X", "k", "M", " bp", " kbp", " Mbp"]
-    for suf in KNOWN_SUFFIXES:
-        if ysuffix is not None and ysuffix == suf.strip():
-            ysuffix = suf
-        if xsuffix is not None and xsuffix == suf.strip():
-            xsuffix = suf
+    if ysuffix is not None:
+        ysuffix = _SUFFIX_BY_STRIPPED.get(ysuffix, ysuffix)
+    if xsuffix is not None:
+        xsuffix = _SUFFIX_BY_STRIPPED.get(xsuffix, xsuffix)
 
     # Set % suffix from ylab if it's in form like "% reads"
     if ysuffix is None and pconfig.ylab:
         if "%" in pconfig.ylab or "percentage" in pconfig.ylab.lower():
             ysuffix = "%"
-        for suf in KNOWN_SUFFIXES:
+        for suf in _KNOWN_SUFFIXES:
             if pconfig.ylab.endswith(f" ({suf.strip()})"):
                 ysuffix = suf
     if xsuffix is None and pconfig.xlab:
         if "%" in pconfig.xlab or "percentage" in pconfig.xlab.lower():
             xsuffix = "%"
-        for suf in KNOWN_SUFFIXES:
+        for suf in _KNOWN_SUFFIXES:
             if pconfig.xlab.endswith(f" ({suf.strip()})"):
                 xsuffix = suf
 
@@ -786,19 +937,13 @@ def _dataset_layout(
                 if ysuffix is None and part.startswith("y") and "}" in part:
                     info = part.split("}")[1].replace("</b>", "")
                     info = info.split(":")[0].split(",")[0].strip().split(" ")[0]
-                    if info:
-                        for suf in KNOWN_SUFFIXES:
-                            if info == suf.strip():
-                                ysuffix = suf
-                                break
+                    if info in _SUFFIX_BY_STRIPPED:
+                        ysuffix = _SUFFIX_BY_STRIPPED[info]
                 elif xsuffix is None and part.startswith("x") and "}" in part:
                     info = part.split("}")[1].replace("</b>", "")
                     info = info.split(":")[0].split(",")[0].strip().split(" ")[0]
-                    if info:
-                        for suf in KNOWN_SUFFIXES:
-                            if info == suf.strip():
-                                xsuffix = suf
-                                break
+                    if info in _SUFFIX_BY_STRIPPED:
+                        xsuffix = _SUFFIX_BY_STRIPPED[info]
 
         # As the suffix will be added automatically for the simple format ({y}), remove it from the label
         if ysuffix is not None:
@@ -865,38 +1010,52 @@ def _dataset_layout(
     return layout, trace_params
 
 
+# Convert HighCharts format to Plotly format
+_TT_LABEL_REPLACEMENTS = {
+    # Replacing "{point.x" and then "x:>" in one go, as the pattern below is applied in a single pass
+    "{point.x:>": "%{x:",
+    "{point.y:>": "%{y:",
+    "{point.x": "%{x",
+    "{point.y": "%{y",
+    "x:>": "x:",
+    "y:>": "y:",
+    "{point.category}": "%{x}",
+    "<strong>": "<b>",
+    "</strong>": "</b>",
+    "<br/>": "<br>",
+}
+_TT_LABEL_RE = re.compile("|".join(re.escape(k) for k in _TT_LABEL_REPLACEMENTS))
+
+
 def _clean_config_tt_label(tt_label: str) -> str:
-    replace_d = {  # Convert HighCharts format to Plotly format
-        "{point.x": "%{x",
-        "{point.y": "%{y",
-        "x:>": "x:",
-        "y:>": "y:",
-        "{point.category}": "%{x}",
-        "<strong>": "<b>",
-        "</strong>": "</b>",
-        "<br/>": "<br>",
-    }
-    for k, v in replace_d.items():
-        tt_label = tt_label.replace(k, v)
-    return tt_label
+    return _TT_LABEL_RE.sub(lambda m: _TT_LABEL_REPLACEMENTS[m.group(0)], tt_label)
+
+
+_WORD_SPLIT_RE = re.compile(r"(\W+)")
 
 
 def split_long_string(s: str, max_width=80) -> List[str]:
     """
     Split string into lines of max_width characters
     """
+    if len(s) <= max_width:
+        # Most labels fit into one line, so no need to split them into words
+        return [s] if s else []
+
     lines = []
-    current_line = ""
-    words = re.split(r"(\W+)", s)
-    for word in words:
-        if len(current_line + word) <= max_width:
-            current_line += word
+    cur: List[str] = []
+    cur_len = 0
+    for word in _WORD_SPLIT_RE.split(s):
+        if cur_len + len(word) <= max_width:
+            cur.append(word)
+            cur_len += len(word)
         else:
-            if current_line:
-                lines.append(current_line)
-            current_line = word
+            if cur_len:
+                lines.append("".join(cur))
+            cur = [word]
+            cur_len = len(word)
 
-    if current_line:
-        lines.append(current_line)
+    if cur_len:
+        lines.append("".join(cur))
 
     return lines
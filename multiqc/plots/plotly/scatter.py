@@ -128,6 +128,7 @@ class Dataset(BaseDataset):
         layout.showlegend = True
 
         in_legend = set()
+        traces = []
         for el in self.points:
             x = el["x"]
             name = el["name"]
@@ -167,8 +168,9 @@ class Dataset(BaseDataset):
             if n_annotated > 0:  # Reduce opacity of the borders that clutter the annotations:
                 marker["line"]["color"] = "rgba(0, 0, 0, .2)"
 
-            fig.add_trace(
-                go.Scatter(
+            traces.append(
+                dict(
+                    type="scatter",
                     x=[x],
                     y=[el["y"]],
                     name=name,
@@ -178,6 +180,8 @@ class Dataset(BaseDataset):
                     **params,
                 )
             )
+        # Adding all traces at once, instead of validating and appending them one by one
+        fig.add_traces(traces)
         fig.layout.height += len(in_legend) * 5  # extra space for legend
         return fig
 
@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Union, Any, Optional, Tuple
 import copy
 
@@ -308,8 +308,7 @@ class Dataset(BaseDataset):
         layout["xaxis"] = layout["xaxis1"]
         layout["yaxis"] = layout["yaxis1"]
 
-        fig = go.Figure(layout=layout)
-
+        traces = []
         violin_values_by_sample_by_metric = self.violin_value_by_sample_by_metric
 
         for metric_idx, metric in enumerate(metrics):
@@ -321,8 +320,9 @@ class Dataset(BaseDataset):
 
             violin_values_by_sample = violin_values_by_sample_by_metric[metric]
             axis_key = "" if metric_idx == 0 else str(metric_idx + 1)
-            fig.add_trace(
-                go.Violin(
+            traces.append(
+                dict(
+                    type="violin",
                     x=list(violin_values_by_sample.values()),
                     name=metric_idx,
                     text=list(violin_values_by_sample.keys()),
@@ -343,8 +343,9 @@ class Dataset(BaseDataset):
                     y = float(metric_idx)
                     # y += random.uniform(-0.2, 0.2)
                     # y += random.random() * 0.3 - 0.3 / 2
-                    fig.add_trace(
-                        go.Scatter(
+                    traces.append(
+                        dict(
+                            type="scatter",
                             x=[value],
                             y=[y],
                             text=[sample],
@@ -353,7 +354,12 @@ class Dataset(BaseDataset):
                             **scatter_params,
                         ),
                     )
-        return fig
+        return go.Figure(data=traces, layout=layout)
+
+    def _fast_dump(self) -> Dict:
+        dump = super()._fast_dump()
+        dump["header_by_metric"] = {metric: asdict(header) for metric, header in self.header_by_metric.items()}
+        return dump
 
     def save_data_file(self) -> None:
         data = {}
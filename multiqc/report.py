@@ -18,7 +18,7 @@ import tempfile
 import time
 from collections import defaultdict
 from pathlib import Path, PosixPath
-from typing import Dict, Union, List, Optional, TextIO, Iterator, Tuple, Any
+from typing import Dict, Union, List, Optional, Set, TextIO, Iterator, Tuple, Any
 
 import rich
 import rich.progress
@@ -27,7 +27,14 @@ from tqdm import tqdm
 
 from multiqc import config
 from multiqc.core import init_log
-from multiqc.utils.util_functions import replace_defaultdicts, is_running_in_notebook, no_unicode, dump_json
+from multiqc.utils.util_functions import (
+    replace_defaultdicts,
+    is_running_in_notebook,
+    no_unicode,
+    dump_json,
+    dump_json_bytes,
+    HAS_ORJSON,
+)
 from multiqc.plots.plotly.plot import Plot
 
 # This does not cause circular imports because BaseMultiqcModule is used only in
@@ -60,6 +67,7 @@ files: Dict
 data_sources: Dict[str, Dict[str, Dict]]
 html_ids: List[str]
 plot_data: Dict[str, Dict] = dict()  # plot dumps to embed in html
+plot_data_inline: Set[str] = set()  # ids of plots with dumps embedded next to their html
 plot_by_id: Dict[str, Plot] = dict()  # plot objects for interactive use
 general_stats_data: List[Dict]
 general_stats_headers: List[Dict]
@@ -86,6 +94,7 @@ def __initialise():
     global data_sources
     global html_ids
     global plot_data
+    global plot_data_inline
     global plot_by_id
     global general_stats_data
     global general_stats_headers
@@ -116,6 +125,7 @@ def __initialise():
     data_sources = defaultdict(lambda: defaultdict(lambda: defaultdict()))
     html_ids = []
     plot_data = dict()
+    plot_data_inline = set()
     plot_by_id = dict()
     general_stats_data = []
     general_stats_headers = []
@@ -813,16 +823,30 @@ def compress_json(data):
     Take a Python data object. Convert to JSON and compress using gzip.
     Represent in base64 format.
     """
-    # Stream to an in-memory buffer rather than compressing the big string
-    # at once. This saves memory.
+    if HAS_ORJSON:
+        # orjson encodes the whole dump at once, but is much faster than the built-in json module
+        return compress_json_bytes(dump_json_bytes(data))
+
     buffer = io.BytesIO()
+    # The compression level 6 gives 10% speed gain vs. 2% extra size, in contrast to default compresslevel=9
+    # Stream to an in-memory buffer rather than compressing the big string at once. This saves memory.
     with gzip.open(buffer, "wt", encoding="utf-8", compresslevel=6) as gzip_buffer:
-        # The compression level 6 gives 10% speed gain vs. 2% extra size, in contrast to default compresslevel=9
         dump_json(data, gzip_buffer)
     base64_bytes = base64.b64encode(buffer.getvalue())
     return base64_bytes.decode("ascii")
 
 
+def compress_json_bytes(json_bytes: bytes) -> str:
+    """
+    Same as compress_json, but for data already encoded as JSON bytes.
+    """
+    buffer = io.BytesIO()
+    with gzip.open(buffer, "wb", compresslevel=6) as gzip_buffer:
+        gzip_buffer.write(json_bytes)
+    base64_bytes = base64.b64encode(buffer.getvalue())
+    return base64_bytes.decode("ascii")
+
+
 def data_tmp_dir() -> str:
     """
     Temporary directory to collect data files from running modules before copying to the final
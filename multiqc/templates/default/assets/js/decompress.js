@@ -45,3 +45,10 @@ function decompressUsingPako(bytes, callback) {
     callback(null, error); // Error callback
   }
 }
+
+// Synchronous version for the data of a single plot, which is decompressed on first access
+function decompressPlotDataSync(base64Str) {
+  const binaryString = atob(base64Str);
+  const bytes = Uint8Array.from(binaryString, (m) => m.codePointAt(0));
+  return decodeDecompressedBytes(pako.inflate(bytes));
+}
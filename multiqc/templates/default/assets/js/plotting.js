@@ -148,26 +148,68 @@ $(function () {
   loadingWarning = $(".mqc_loading_warning").show();
 });
 
+// Plot data embedded next to the plot is only decompressed when the plot is first accessed
+function addLazyPlot(plots, scriptEl) {
+  let target = scriptEl.dataset.pid;
+  Object.defineProperty(plots, target, {
+    configurable: true,
+    enumerable: true,
+    get() {
+      let plot = initPlot(decompressPlotDataSync(scriptEl.textContent.trim()));
+      scriptEl.remove(); // the data is not needed in the DOM anymore
+      Object.defineProperty(plots, target, { value: plot, writable: true, configurable: true, enumerable: true });
+      return plot;
+    },
+    set(plot) {
+      Object.defineProperty(plots, target, { value: plot, writable: true, configurable: true, enumerable: true });
+    },
+  });
+}
+
 callAfterDecompressed.push(function (mqc_plotdata) {
   mqc_plots = Object.fromEntries(Object.values(mqc_plotdata).map((data) => [data.id, initPlot(data)]));
-
-  let shouldRender = $(".hc-plot.not_rendered:visible:not(.gt_max_num_ds)");
-
-  // Render plots on page load
+  document.querySelectorAll("script.mqc-plot-data[data-lazy]").forEach((el) => addLazyPlot(mqc_plots, el));
+
+  let shouldRender = $(".hc-plot.not_rendered:not(.gt_max_num_ds)");
+  let pending = 0;
+  let firstCallback = true;
+
+  // Render plots when they are scrolled into view
+  let observer = new IntersectionObserver(
+    function (entries) {
+      entries.forEach(function (entry) {
+        if (!entry.isIntersecting) return;
+        observer.unobserve(entry.target);
+        let target = entry.target.id;
+        pending += 1;
+        // Deferring each plot call prevents browser from locking up
+        setTimeout(function () {
+          if ($(entry.target).hasClass("not_rendered")) renderPlot(target);
+          pending -= 1;
+          // All plots in view rendered successfully, so hiding the warning
+          if (pending === 0) loadingWarning.hide();
+        }, 50);
+      });
+      if (firstCallback && pending === 0) loadingWarning.hide();
+      firstCallback = false;
+    },
+    { rootMargin: "200px" },
+  );
   shouldRender.each(function () {
-    let target = $(this).attr("id");
-    // Deferring each plot call prevents browser from locking up
-    setTimeout(function () {
-      renderPlot(target);
-      if ($(".hc-plot.not_rendered:visible:not(.gt_max_num_ds)").length === 0)
-        // All plots rendered successfully (or hidden with gt_max_num_ds), so hiding the warning
-        $(".mqc_loading_warning").hide();
-    }, 50);
+    observer.observe(this);
   });
 
-  // All plots rendered successfully (or hidden with gt_max_num_ds), so hiding the warning
+  // No plots to render, so hiding the warning
   if (shouldRender.length === 0) loadingWarning.hide();
 
+  // Printing or saving the report as PDF from the browser should show the plots that were not scrolled into view
+  window.addEventListener("beforeprint", function () {
+    shouldRender.filter(".not_rendered:visible").each(function () {
+      observer.unobserve(this);
+      renderPlot($(this).attr("id"));
+    });
+  });
+
   // Render a plot when clicked (heavy plots are not automatically rendered by default)
   $("body").on("click", ".render_plot", function (e) {
     renderPlot($(this).parent().attr("id"));
@@ -0,0 +1,32 @@
+import array
+import json
+import math
+
+import pytest
+
+from multiqc.utils.util_functions import dump_json, dump_json_bytes
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"nan": math.nan, "inf": math.inf, "-inf": -math.inf, "list": [1.5, math.nan, (2, math.inf)]},
+        {"array": array.array("d", [1.0, 2.5]), "ints": array.array("i", [1, 2])},
+        {"set": {3}, "tuple": (1, "a", None)},
+        {"callable": lambda x: x, "nested": {"f": len}},
+        {1: "int key", 2.5: "float key", True: "bool key", None: "none key"},
+        {"big": 2**70, "small": -(2**70), "nested": [{"big": 2**64}]},
+        [],
+        "string",
+    ],
+)
+def test_dump_json_bytes_same_as_dump_json(data):
+    assert json.loads(dump_json_bytes(data)) == json.loads(dump_json(data, None))
+
+
+def test_dump_json_bytes_without_orjson(monkeypatch):
+    from multiqc.utils import util_functions
+
+    monkeypatch.setattr(util_functions, "orjson", None)
+    data = {"nan": math.nan, 1: (2, array.array("i", [3]))}
+    assert json.loads(dump_json_bytes(data)) == {"nan": None, "1": [2, [3]]}
@@ -0,0 +1,62 @@
+"""Test the plot dumps kept in report.plot_data for the data exports, and embedded into the report."""
+
+import base64
+import gzip
+import json
+import math
+import re
+
+import pytest
+
+from multiqc import config, report
+from multiqc.core import write_results
+from multiqc.plots import bargraph, linegraph
+from multiqc.utils.util_functions import dump_json
+
+
+@pytest.fixture
+def clean_report():
+    report.reset()
+    yield
+    report.reset()
+
+
+def test_plot_data_unchanged_by_flat_plot_and_export(clean_report):
+    line_data = {"sample_1": {1: 2.0, 2: math.nan, 3: 5.0}, "sample_2": {1: 1.0, 2: 3.0, 3: math.inf}}
+    bar_data = {"sample_1": {"a": 1, "b": 2}, "sample_2": {"a": 3, "b": 4}}
+    plots = [
+        linegraph.plot(line_data, {"id": "test_line", "title": "Line"}),
+        bargraph.plot(bar_data, None, {"id": "test_bar", "title": "Bar"}),
+    ]
+    for plot in plots:
+        plot.interactive_plot()
+    plot_data_json = dump_json(report.plot_data, None, sort_keys=True)
+    lines_before = [dict(line, data=list(line["data"])) for line in plots[0].datasets[0].lines]
+
+    for plot in plots:
+        plot.flat_plot()
+    assert dump_json(report.plot_data, None, sort_keys=True) == plot_data_json
+
+    # Writing the data export replaces NaNs in place, which should not reach the plots
+    dump_json(report.plot_data, None)
+    lines_after = plots[0].datasets[0].lines
+    assert [line.keys() for line in lines_after] == [line.keys() for line in lines_before]
+    assert math.isnan(dict(lines_after[0]["data"])[2])
+    assert "width" not in report.plot_data["test_line"]["datasets"][0]["lines"][0].get("line", {})
+
+
+def test_inline_plot_data(clean_report):
+    plot = linegraph.plot({"sample_1": {1: 2.0, 2: math.nan}}, {"id": "test_line", "title": "Line"})
+    html = plot.interactive_plot()
+    match = re.search(r'<script type="text/plain" id="test_line-data"[^>]*>(.*)</script>', html)
+    embedded = json.loads(gzip.decompress(base64.b64decode(match.group(1))))
+    assert embedded == json.loads(dump_json(report.plot_data["test_line"], None))
+
+
+def test_inline_plot_data_not_in_compressed_json(clean_report, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "output_fn", str(tmp_path / "multiqc_report.html"))
+    bargraph.plot({"sample_1": {"a": 1}}, None, {"id": "test_bar", "title": "Bar"}).interactive_plot()
+    report.plot_data["test_other"] = {"id": "test_other"}
+    write_results._write_report()
+    compressed = json.loads(gzip.decompress(base64.b64decode(report.plot_compressed_json)))
+    assert list(compressed) == ["test_other"]
@@ -0,0 +1,13 @@
+"""Test creating Plotly figures from the plot models."""
+
+from multiqc.plots import bargraph
+
+
+def test_get_figure_follows_layout_updates():
+    plot = bargraph.plot({"sample_1": {"a": 1, "b": 2}}, None, {"id": "test_bar", "title": "Bar"})
+    plot.get_figure(0)
+    plot.layout.height = 987
+    assert plot.get_figure(0).layout.height == 987
+    plot.flat_plot()
+    plot.layout.height = 654
+    assert plot.get_figure(0).layout.height == 654
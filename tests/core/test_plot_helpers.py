@@ -0,0 +1,58 @@
+"""Test the helper functions of the Plotly plots."""
+
+import pytest
+
+from multiqc.plots.plotly.plot import PConfig, _clean_config_tt_label, _dataset_layout, split_long_string
+
+
+@pytest.mark.parametrize(
+    "s, max_width, expected",
+    [
+        ("", 10, []),
+        ("aaaa bbbb", 9, ["aaaa bbbb"]),
+        ("aaaa bbbb", 8, ["aaaa ", "bbbb"]),
+        ("a" * 12, 5, ["a" * 12]),
+        ("sample_1 - sample_2", 8, ["sample_1", " - ", "sample_2"]),
+        (" leading space", 7, [" ", "leading", " space"]),
+    ],
+)
+def test_split_long_string(s, max_width, expected):
+    assert split_long_string(s, max_width) == expected
+
+
+@pytest.mark.parametrize(
+    "pconfig, ysuffix, xsuffix",
+    [
+        ({}, "", ""),
+        ({"ysuffix": "bp", "xsuffix": "x"}, " bp", "x"),
+        ({"ysuffix": " Mbp", "xsuffix": "reads"}, " Mbp", "reads"),
+        ({"tt_suffix": "k"}, "k", ""),
+        ({"ylab_format": "{value}%"}, "%", ""),
+        ({"ylab": "Length (kbp)", "xlab": "Coverage (X)"}, " kbp", "X"),
+        ({"ylab": "% of reads"}, "%", ""),
+        ({"tt_label": "{point.x}: {point.y:.2f}%"}, "%", ""),
+        ({"tt_label": "<b>{point.x} bp</b>: %{y} M"}, "M", " bp"),
+        ({"tt_label": "%{y}: %{x:.1f}"}, "", ""),
+        ({"tt_label": "%{x} %{y} reads"}, "", ""),
+    ],
+)
+def test_dataset_layout_suffixes(pconfig, ysuffix, xsuffix):
+    layout, _ = _dataset_layout(PConfig(id="test_plot", title="Test", **pconfig), {}, None)
+    assert layout["yaxis"]["ticksuffix"] == ysuffix
+    assert layout["xaxis"]["ticksuffix"] == xsuffix
+
+
+@pytest.mark.parametrize(
+    "tt_label, expected",
+    [
+        ("", ""),
+        ("{point.x:>,.0f}", "%{x:,.0f}"),
+        ("{point.y}", "%{y}"),
+        ("{point.y:.2f}%", "%{y:.2f}%"),
+        ("x:>", "x:"),
+        ("<strong>{point.category}</strong><br/>", "<b>%{x}</b><br>"),
+        ("%{y} reads", "%{y} reads"),
+    ],
+)
+def test_clean_config_tt_label(tt_label, expected):
+    assert _clean_config_tt_label(tt_label) == expected